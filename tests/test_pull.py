@@ -0,0 +1,147 @@
+import json
+
+import pytest
+
+import cli
+from utils import ai as ai_gen, leetcode as lc_fetch, manifest
+
+QUESTION = {
+    "questionId": "1",
+    "title": "Two Sum",
+    "content": "<p>Find two.</p>",
+    "difficulty": "Easy",
+    "topicTags": [{"name": "Array"}],
+}
+GENERATED = "from solution import Solution\n\ndef test_generated():\n    assert True\n"
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Point `pull` at a temp workspace with a fake upstream and a fake AI."""
+    state = {"question": dict(QUESTION), "fetches": 0, "generations": 0, "fingerprint": "prompt-v1:stub"}
+    cache = tmp_path / "cache.json"
+    cache.write_text(json.dumps({"data": {"question": QUESTION}}), encoding="utf-8")
+
+    def fake_fetch(slug, force=False):
+        state["fetches"] += 1
+        return state["question"], "cache"
+
+    def fake_generate(statement):
+        state["generations"] += 1
+        return GENERATED
+
+    monkeypatch.setattr(cli, "PROBLEMS_DIR", tmp_path / "problems")
+    monkeypatch.setattr(lc_fetch, "cache_path", lambda slug: cache)
+    monkeypatch.setattr(lc_fetch, "fetch_question", fake_fetch)
+    monkeypatch.setattr(ai_gen, "generate_tests", fake_generate)
+    monkeypatch.setattr(ai_gen, "prompt_fingerprint", lambda: state["fingerprint"])
+    state["dir"] = tmp_path / "problems" / "two-sum"
+    return state
+
+
+def test_first_pull_writes_files_and_manifest(workspace):
+    cli._pull_one("two-sum", force=False)
+    d = workspace["dir"]
+    assert (d / "README.md").read_text(encoding="utf-8").startswith("# Two Sum")
+    assert (d / "test_solution.py").read_text(encoding="utf-8") == GENERATED
+    man = manifest.load(d)
+    assert man["tests"] == manifest.sha256_text(GENERATED)
+    assert workspace["generations"] == 1
+
+
+def test_repull_takes_fast_path(workspace):
+    cli._pull_one("two-sum", force=False)
+    cli._pull_one("two-sum", force=False)
+    assert workspace["fetches"] == 1
+    assert workspace["generations"] == 1
+
+
+def test_prompt_change_regenerates_unedited_tests(workspace):
+    cli._pull_one("two-sum", force=False)
+    workspace["fingerprint"] = "prompt-v2:stub"
+    cli._pull_one("two-sum", force=False)
+    assert workspace["generations"] == 2
+
+
+def test_edited_tests_are_kept_and_become_fresh(workspace):
+    cli._pull_one("two-sum", force=False)
+    tests = workspace["dir"] / "test_solution.py"
+    tests.write_text(GENERATED + "# mine\n", encoding="utf-8")
+    workspace["fingerprint"] = "prompt-v2:stub"
+    cli._pull_one("two-sum", force=False)
+    assert tests.read_text(encoding="utf-8").endswith("# mine\n")
+    assert workspace["generations"] == 1
+    cli._pull_one("two-sum", force=False)
+    assert workspace["fetches"] == 2
+
+
+def test_missing_tests_are_regenerated(workspace):
+    cli._pull_one("two-sum", force=False)
+    (workspace["dir"] / "test_solution.py").unlink()
+    cli._pull_one("two-sum", force=False)
+    assert workspace["generations"] == 2
+
+
+@pytest.mark.parametrize("existing, regenerated", [
+    ("from solution import Solution\n\ndef test_mine():\n    assert True\n", False),
+    (ai_gen.OFFLINE_STUB, True),
+    (ai_gen.OFFLINE_STUB.replace("\n", "\r\n"), True),
+    (ai_gen.GENERATION_FAILED_MARKER + " after retries: boom\n", True),
+])
+def test_legacy_tests_without_manifest(workspace, existing, regenerated):
+    d = workspace["dir"]
+    d.mkdir(parents=True)
+    (d / "solution.py").write_text("class Solution:\n    pass\n", encoding="utf-8")
+    (d / "test_solution.py").write_bytes(existing.encode("utf-8"))
+    cli._pull_one("two-sum", force=False)
+    assert workspace["generations"] == (1 if regenerated else 0)
+    # either way the problem is now in sync
+    cli._pull_one("two-sum", force=False)
+    assert workspace["fetches"] == 1
+
+
+def test_failed_generation_is_retried(workspace, monkeypatch):
+    monkeypatch.setattr(ai_gen, "generate_tests", lambda statement: ai_gen.GENERATION_FAILED_MARKER + ": boom\n")
+    cli._pull_one("two-sum", force=False)
+    assert manifest.load(workspace["dir"])["tests_input"] is None
+    monkeypatch.setattr(ai_gen, "generate_tests", lambda statement: GENERATED)
+    cli._pull_one("two-sum", force=False)
+    assert (workspace["dir"] / "test_solution.py").read_text(encoding="utf-8") == GENERATED
+
+
+def test_readme_rerendered_on_question_or_renderer_change(workspace, monkeypatch):
+    cli._pull_one("two-sum", force=False)
+    readme = workspace["dir"] / "README.md"
+    workspace["question"] = {**QUESTION, "title": "Two Sum II"}
+    cli._pull_one("two-sum", force=True)
+    assert readme.read_text(encoding="utf-8").startswith("# Two Sum II")
+
+    monkeypatch.setattr(lc_fetch, "render_statement", lambda q, slug: "# rendered v2\n")
+    cli._pull_one("two-sum", force=False)  # unchanged RENDER_VERSION: fast path
+    assert readme.read_text(encoding="utf-8").startswith("# Two Sum II")
+    monkeypatch.setattr(lc_fetch, "RENDER_VERSION", lc_fetch.RENDER_VERSION + 1)
+    cli._pull_one("two-sum", force=False)
+    assert readme.read_text(encoding="utf-8") == "# rendered v2\n"
+
+
+def test_is_fresh(tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("x", encoding="utf-8")
+    statement = manifest.sha256_text("s")
+    question = manifest.sha256_json(QUESTION)
+    man = {
+        "question": question,
+        "statement_input": manifest.statement_input_key(1, question),
+        "statement": statement,
+        "tests_input": manifest.tests_input_key("fp", statement),
+        "stat": {"a": manifest.stat_signature(f)},
+    }
+    files = {"a": f}
+    assert manifest.is_fresh(man, files, "fp", 1)
+    assert not manifest.is_fresh(man, files, "other-fp", 1)
+    assert not manifest.is_fresh(man, files, "fp", 2)
+    assert not manifest.is_fresh({}, files, "fp", 1)
+    f.write_text("xy", encoding="utf-8")
+    assert not manifest.is_fresh(man, files, "fp", 1)
+    f.unlink()
+    assert not manifest.is_fresh(man, files, "fp", 1)
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+
+from utils import stress
+
+BRUTE = '''from typing import List
+class Solution:
+    def maxSub(self, nums: List[int]) -> int:
+        return max(sum(nums[i:j]) for i in range(len(nums)) for j in range(i + 1, len(nums) + 1))
+'''
+
+# Kadane with best initialised to 0: wrong whenever every element is negative.
+BUGGY = '''from typing import List
+class Solution:
+    def maxSub(self, nums: List[int]) -> int:
+        best = cur = 0
+        for x in nums:
+            cur = max(x, cur + x)
+            best = max(best, cur)
+        return best
+'''
+
+
+def _problem(tmp_path: Path, solution: str, brute: str = BRUTE) -> Path:
+    (tmp_path / "solution.py").write_text(solution, encoding="utf-8")
+    (tmp_path / "brute.py").write_text(brute, encoding="utf-8")
+    return tmp_path
+
+
+def test_shrink_max_subarray_bug_to_single_negative(tmp_path):
+    problem = _problem(tmp_path, BUGGY)
+    limits = dict(stress.DEFAULT_LIMITS)
+    args = [[-7, -3, -9, -2]]
+    failure = {"got": 0, "expected": -2}
+    args, failure = stress.shrink(problem, "maxSub", True, limits, args, failure, timeout=5)
+    assert args == [[-1]]
+    assert failure == {"got": 0, "expected": -1}
+
+
+def test_stress_finds_and_saves_counterexample(tmp_path):
+    problem = _problem(tmp_path, BUGGY)
+    assert stress.stress(problem, cases=2000, workers=1, seed=0) is False
+    saved = (problem / "test_solution.py").read_text(encoding="utf-8")
+    assert "from solution import Solution" in saved
+    assert "assert Solution().maxSub([-1]) == -1" in saved
+
+
+def test_save_counterexample_keeps_future_imports_first(tmp_path):
+    (tmp_path / "test_solution.py").write_text(
+        '"""Doc."""\nfrom __future__ import annotations\n\n\ndef test_a():\n    pass\n', encoding="utf-8"
+    )
+    stress.save_counterexample(tmp_path, "f", [[1]], {"got": 1, "expected": 2}, seed=0)
+    source = (tmp_path / "test_solution.py").read_text(encoding="utf-8")
+    compile(source, "test_solution.py", "exec")
+    assert source.index("from __future__") < source.index("import pytest")
+
+
+def test_same_unordered():
+    assert not stress._same([[1, 2], [3]], [[3], [1, 2]])
+    assert stress._same([[1, 2], [3]], [[3], [2, 1]], unordered=True)
+    assert not stress._same([1, 2], [1, 2, 2], unordered=True)
+    assert stress._same([0.1 + 0.2], [0.3])
+
+
+def test_unordered_normalises_nested_lists():
+    assert stress._unordered([[2, 1], [0]]) == [[0], [1, 2]]
+    assert stress._unordered(5) == 5
+
+
+@pytest.mark.parametrize("bad", [
+    {"min_size": 5, "max_size": 3},
+    {"min_size": -1},
+    {"min_value": 3, "max_value": 1},
+    {"alphabet": ""},
+])
+def test_validate_limits_rejects_bad_bounds(bad):
+    with pytest.raises(ValueError):
+        stress.validate_limits({**stress.DEFAULT_LIMITS, **bad})
+
+
+def test_generators_respect_bounds():
+    import random
+    from typing import List
+
+    limits = {**stress.DEFAULT_LIMITS, "min_size": 2, "max_size": 3, "min_value": 0, "max_value": 1}
+    gen = stress._make_generator(List[List[int]], limits)
+    rnd = random.Random(0)
+    for _ in range(100):
+        value = gen(rnd)
+        assert 2 <= len(value) <= 3
+        assert all(2 <= len(row) <= 3 and set(row) <= {0, 1} for row in value)
@@ -14,6 +14,31 @@ GEMINI_ENDPOINT = os.getenv(
     f"https://generative.googleapis.com/v1beta2/models/{GEMINI_MODEL}:generateText",
 )
 
+# Bump when the prompt in generate_tests changes so `pull` knows existing tests are stale.
+PROMPT_VERSION = 1
+# First line of the stub written when generation fails; such tests are retried on the next pull.
+GENERATION_FAILED_MARKER = "# AI generation failed"
+
+# Written when no API key is configured.
+OFFLINE_STUB = '''import pytest
+from solution import Solution
+
+def test_stub():
+    s = Solution()
+    assert hasattr(s, "__class__")
+'''
+
+def is_placeholder(tests: str) -> bool:
+    """True for stub tests we wrote ourselves (offline stub or failed generation), which are safe to replace."""
+    # files written in text mode on Windows have \r\n line endings
+    tests = tests.replace("\r\n", "\n")
+    return tests.startswith(GENERATION_FAILED_MARKER) or tests == OFFLINE_STUB
+
+def prompt_fingerprint() -> str:
+    """Identify the prompt + model that generate_tests would use right now ('stub' without a key)."""
+    model = GEMINI_MODEL if GEMINI_KEY else "stub"
+    return f"prompt-v{PROMPT_VERSION}:{model}"
+
 # Helpers to extract JSON or python code blocks from model output
 def _extract_json(text: str) -> Optional[dict]:
     try:
@@ -90,13 +115,7 @@ def generate_tests(problem_statement: str, timeout: int = 30) -> str:
     """
     # Offline stub if key missing
     if not GEMINI_KEY:
-        return '''import pytest
-from solution import Solution
-
-def test_stub():
-    s = Solution()
-    assert hasattr(s, "__class__")
-'''
+        return OFFLINE_STUB
 
     prompt = (
         f"You are a code-generation assistant. Input: a LeetCode problem statement {problem_statement}.\n"
@@ -157,7 +176,7 @@ def test_stub():
             time.sleep(wait)
 
     # If we reach here, call failed repeatedly
-    return f'''# AI generation failed after retries: {last_exc}
+    return f'''{GENERATION_FAILED_MARKER} after retries: {last_exc}
 import pytest
 from solution import Solution
 
@@ -1,8 +1,9 @@
 import requests
 from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Optional, Tuple
 from pathlib import Path
 import json
+from utils.manifest import atomic_write_text
 
 GRAPHQL_ENDPOINT = "https://leetcode.com/graphql"
 QUESTION_QUERY = """
@@ -20,6 +21,9 @@ query getQuestionDetail($titleSlug: String!) {
 }
 """
 
+# Bump when _question_to_markdown changes so `pull` re-renders existing README.md files.
+RENDER_VERSION = 1
+
 # cache dir (project root /.cache)
 _PROJECT_ROOT = Path(__file__).resolve().parents[1]
 CACHE_DIR = _PROJECT_ROOT / ".cache"
@@ -57,26 +61,34 @@ def _question_to_markdown(q: dict, slug: str) -> str:
 
     return "\n\n".join([p for p in md_parts if p]).strip()
 
-def _cache_path(slug: str) -> Path:
+def cache_path(slug: str) -> Path:
     return CACHE_DIR / f"{slug}.json"
 
-def fetch_problem(slug: str, force: bool = False) -> str:
+def render_statement(q: dict, slug: str) -> str:
+    """Render a GraphQL question object to the Markdown written to README.md."""
+    return _question_to_markdown(q, slug)
+
+def _read_cached_question(cache_file: Path) -> Optional[dict]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        return data.get("data", {}).get("question") or None
+    except Exception:
+        return None
+
+def fetch_question(slug: str, force: bool = False) -> Tuple[Optional[dict], str]:
     """
-    Use LeetCode GraphQL to fetch question content and return Markdown.
-    Caches GraphQL JSON at .cache/<slug>.json. Set force=True to ignore cache.
+    Fetch the GraphQL question object for slug, using .cache/<slug>.json unless force=True.
+    Returns (question, note): on success note says where the question came from
+    ("cache", "network" or "fallback"); on failure question is None and note is the error.
+    The cache file is only rewritten when the response changed, so its mtime stays stable.
     """
-    cache_file = _cache_path(slug)
+    cache_file = cache_path(slug)
     # Try cache first (unless forcing)
     if cache_file.exists() and not force:
-        try:
-            data = json.loads(cache_file.read_text(encoding="utf-8"))
-            q = data.get("data", {}).get("question")
-            if q:
-                return _question_to_markdown(q, slug) + f"\n\n<!-- Cached: {cache_file.name} -->"
-            # if cache invalid fall through to network fetch
-        except Exception:
-            # ignore parse errors and fetch fresh
-            pass
+        q = _read_cached_question(cache_file)
+        if q:
+            return q, "cache"
+        # if cache invalid fall through to network fetch
 
     # Perform GraphQL fetch
     try:
@@ -84,28 +96,25 @@ def fetch_problem(slug: str, force: bool = False) -> str:
         headers = {"Content-Type": "application/json", "Referer": f"https://leetcode.com/problems/{slug}/"}
         r = requests.post(GRAPHQL_ENDPOINT, json=payload, headers=headers, timeout=10)
         if r.status_code != 200:
-            return f"# {slug}\n\nGraphQL fetch failed (status {r.status_code})."
+            return None, f"GraphQL fetch failed (status {r.status_code})."
 
         resp_json = r.json()
         # Save to cache (best-effort)
         try:
-            cache_file.write_text(json.dumps(resp_json, ensure_ascii=False), encoding="utf-8")
+            text = json.dumps(resp_json, ensure_ascii=False)
+            if not cache_file.exists() or cache_file.read_text(encoding="utf-8") != text:
+                atomic_write_text(cache_file, text)
         except Exception:
             pass
 
         q = resp_json.get("data", {}).get("question")
         if not q:
-            return f"# {slug}\n\nQuestion not found in GraphQL response."
-
-        return _question_to_markdown(q, slug)
+            return None, "Question not found in GraphQL response."
+        return q, "network"
     except Exception as e:
         # fallback: try to use cached file even if force was true but network failed
         if cache_file.exists():
-            try:
-                data = json.loads(cache_file.read_text(encoding="utf-8"))
-                q = data.get("data", {}).get("question")
-                if q:
-                    return _question_to_markdown(q, slug) + "\n\n<!-- Fallback to cached content due to network error -->"
-            except Exception:
-                pass
-        return f"# {slug}\n\nFetch error: {e}"
+            q = _read_cached_question(cache_file)
+            if q:
+                return q, "fallback"
+        return None, f"Fetch error: {e}"
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Per-problem record of what `pull` generated, stored at problems/<slug>/.manifest.json:
+#   question    - hash of the upstream GraphQL question object
+#   statement_input - hash of (renderer version, question) the README was rendered from
+#   statement   - hash of the rendered README.md
+#   tests_input - hash of (prompt/model fingerprint, statement) the tests were generated from
+#   tests       - hash of test_solution.py as generated (a different hash on disk = user edits)
+#                 tests_input is also set when user-edited tests are kept, so they count as fresh
+#   stat        - [mtime_ns, size] of the tracked files, for the no-read fast path
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 1
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_json(obj) -> str:
+    """Hash a JSON-serialisable object independent of key order."""
+    return sha256_text(json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")))
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    try:
+        return sha256_bytes(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def stat_signature(path: Path) -> Optional[list]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def atomic_write_text(path: Path, text: str):
+    """Write via a temp file in the same directory + os.replace, so readers never see partial files."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; keep the existing mode, or the umask default for new files
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp, mode)
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load(problem_dir: Path) -> dict:
+    """Return the problem's manifest, or {} if missing, unreadable or from another version."""
+    try:
+        data = json.loads((problem_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data
+
+
+def save(problem_dir: Path, manifest: dict):
+    manifest = {**manifest, "version": MANIFEST_VERSION}
+    atomic_write_text(problem_dir / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+def statement_input_key(render_version: int, question_hash: str) -> str:
+    return sha256_text(f"render-v{render_version}\n{question_hash}")
+
+
+def tests_input_key(fingerprint: str, statement_hash: str) -> str:
+    return sha256_text(f"{fingerprint}\n{statement_hash}")
+
+
+def is_fresh(manifest: dict, files: dict, fingerprint: str, render_version: int) -> bool:
+    """
+    True if nothing tracked has changed since the last pull, judged by stat() alone.
+
+    `files` maps names to paths; each must exist with the [mtime_ns, size] recorded
+    in the manifest, the README must have been rendered by the current renderer
+    and the tests generated with the current prompt/model fingerprint.
+    """
+    if not manifest or "statement" not in manifest or "question" not in manifest:
+        return False
+    if manifest.get("statement_input") != statement_input_key(render_version, manifest["question"]):
+        return False
+    if manifest.get("tests_input") != tests_input_key(fingerprint, manifest["statement"]):
+        return False
+    recorded = manifest.get("stat", {})
+    for name, path in files.items():
+        sig = stat_signature(path)
+        if sig is None or recorded.get(name) != sig:
+            return False
+    return True
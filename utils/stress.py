@@ -0,0 +1,511 @@
+import ast
+import copy
+import importlib.util
+import inspect
+import math
+import multiprocessing
+import os
+import queue
+import random
+import re
+import sys
+import time
+import typing
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from utils.manifest import atomic_write_text
+
+# Default bounds for generated inputs. Small values collide more often,
+# which is where off-by-one and duplicate-handling bugs tend to hide.
+DEFAULT_LIMITS = {
+    "min_size": 1,
+    "max_size": 8,
+    "min_value": -10,
+    "max_value": 10,
+    "alphabet": "abc",
+}
+
+BATCH_SIZE = 250
+MAX_SHRINK_STEPS = 2000
+# seconds a batch may run before it is treated as hung (e.g. an infinite loop)
+BATCH_TIMEOUT = 10.0
+# fail the run if brute.py rejects at least this share of the generated inputs
+MAX_SKIP_RATIO = 0.9
+
+# _check result for inputs the oracle rejects (outside the problem's constraints)
+SKIPPED = "skipped"
+
+# per-process cache of loaded modules: path -> module
+_MODULES: dict = {}
+
+
+def _load_module(path: Path):
+    """Import a file by path (cached per process) so solution.py and brute.py can coexist."""
+    key = str(path)
+    if key in _MODULES:
+        return _MODULES[key]
+    # allow solution/brute to import helpers living next to them
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    name = f"_lc_stress_{path.stem}_{abs(hash(key))}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _MODULES[key] = module
+    return module
+
+
+def find_method(solution_path: Path, method: Optional[str] = None) -> str:
+    """Return the name of the Solution method to stress (first public one unless given)."""
+    module = _load_module(solution_path)
+    cls = getattr(module, "Solution", None)
+    if cls is None:
+        raise ValueError(f"No class Solution in {solution_path}")
+    names = [n for n, v in vars(cls).items() if callable(v) and not n.startswith("_")]
+    if method:
+        if method not in names:
+            raise ValueError(f"Solution has no method '{method}' (found: {', '.join(names) or 'none'})")
+        return method
+    if not names:
+        raise ValueError("Solution defines no public methods to test.")
+    return names[0]
+
+
+def _param_types(module, method: str) -> list:
+    """Resolve parameter annotations (excluding self) of Solution.<method>."""
+    func = getattr(module.Solution, method)
+    globalns = {**vars(typing), **vars(module)}
+    try:
+        hints = typing.get_type_hints(func, globalns=globalns)
+    except Exception:
+        hints = getattr(func, "__annotations__", {})
+    params = list(inspect.signature(func).parameters.values())[1:]
+    types = []
+    for p in params:
+        t = hints.get(p.name, p.annotation)
+        if t is inspect.Parameter.empty:
+            raise ValueError(f"Parameter '{p.name}' has no type annotation; cannot derive a generator.")
+        types.append(t)
+    return types
+
+
+def validate_limits(limits: dict):
+    """Reject bounds the generators cannot satisfy before any worker tries to use them."""
+    if limits["min_size"] < 0:
+        raise ValueError(f"--min-size must be >= 0 (got {limits['min_size']})")
+    if limits["min_size"] > limits["max_size"]:
+        raise ValueError(f"--min-size ({limits['min_size']}) is larger than --max-size ({limits['max_size']})")
+    if limits["min_value"] > limits["max_value"]:
+        raise ValueError(f"--min-value ({limits['min_value']}) is larger than --max-value ({limits['max_value']})")
+    if not limits["alphabet"]:
+        raise ValueError("--alphabet must not be empty")
+
+
+def _make_generator(t, limits: dict) -> Callable[[random.Random], Any]:
+    """Build a random value generator for a type annotation."""
+    origin = typing.get_origin(t)
+    if t is int:
+        return lambda rnd: rnd.randint(limits["min_value"], limits["max_value"])
+    if t is float:
+        return lambda rnd: round(rnd.uniform(limits["min_value"], limits["max_value"]), 3)
+    if t is bool:
+        return lambda rnd: rnd.random() < 0.5
+    if t is str:
+        return lambda rnd: "".join(
+            rnd.choice(limits["alphabet"]) for _ in range(rnd.randint(limits["min_size"], limits["max_size"]))
+        )
+    if origin in (list, typing.List):
+        args = typing.get_args(t)
+        inner = _make_generator(args[0] if args else int, limits)
+        return lambda rnd: [inner(rnd) for _ in range(rnd.randint(limits["min_size"], limits["max_size"]))]
+    raise ValueError(f"Unsupported parameter type for random generation: {t!r}")
+
+
+def _call(cls, method: str, args: list):
+    """Run one case; returns ("ok", outcome) or ("error", repr(exc)).
+
+    Methods that return None are assumed to modify their arguments in place,
+    so the mutated arguments become the outcome.
+    """
+    args = copy.deepcopy(args)
+    try:
+        result = getattr(cls(), method)(*args)
+    except Exception as e:
+        return "error", f"{type(e).__name__}: {e}"
+    if result is None:
+        return "ok", ("in-place", args)
+    return "ok", result
+
+
+def _unordered(x):
+    """Normalise an "any order" answer by sorting lists recursively."""
+    if isinstance(x, (list, tuple)):
+        return sorted((_unordered(i) for i in x), key=repr)
+    return x
+
+
+def _same(a, b, unordered: bool = False) -> bool:
+    if unordered:
+        a, b = _unordered(a), _unordered(b)
+    if isinstance(a, float) or isinstance(b, float):
+        try:
+            return math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-6)
+        except TypeError:
+            return False
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _check(sol_cls, brute_cls, method: str, args: list, unordered: bool = False):
+    """Return a failure description (dict) for args, None if the case passes, or SKIPPED."""
+    status, got = _call(sol_cls, method, args)
+    if brute_cls is None:
+        # no oracle: only crashes count as failures
+        return {"got": got} if status == "error" else None
+    b_status, expected = _call(brute_cls, method, args)
+    if b_status == "error":
+        # the oracle rejects this input, so treat it as outside the constraints
+        return SKIPPED
+    if status == "error" or not _same(got, expected, unordered):
+        return {"got": got, "expected": expected}
+    return None
+
+
+def _load_classes(problem_dir: Path, use_brute: bool):
+    sol_cls = _load_module(problem_dir / "solution.py").Solution
+    brute_cls = _load_module(problem_dir / "brute.py").Solution if use_brute else None
+    return sol_cls, brute_cls
+
+
+def _batch_inputs(problem_dir: Path, method: str, limits: dict, seed: int, count: int):
+    """Yield the `count` inputs of the batch identified by `seed` (deterministic, so batches can be replayed)."""
+    gens = [_make_generator(t, limits) for t in _param_types(_load_module(problem_dir / "solution.py"), method)]
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield [g(rnd) for g in gens]
+
+
+def _run_batch(problem_dir: str, method: str, use_brute: bool, limits: dict, unordered: bool, seed: int, count: int):
+    """Worker entry point: run a batch of random cases and stop at the first failure.
+
+    Returns (cases run, cases skipped, failing args or None, failure dict or None).
+    """
+    problem_dir = Path(problem_dir)
+    sol_cls, brute_cls = _load_classes(problem_dir, use_brute)
+    ran = skipped = 0
+    for args in _batch_inputs(problem_dir, method, limits, seed, count):
+        ran += 1
+        result = _check(sol_cls, brute_cls, method, args, unordered)
+        if result is SKIPPED:
+            skipped += 1
+        elif result is not None:
+            return ran, skipped, args, result
+    return ran, skipped, None, None
+
+
+def _run_case(problem_dir: str, method: str, use_brute: bool, unordered: bool, args: list):
+    """Worker entry point for replaying a single case."""
+    sol_cls, brute_cls = _load_classes(Path(problem_dir), use_brute)
+    return _check(sol_cls, brute_cls, method, args, unordered)
+
+
+def find_hanging_case(problem_dir: Path, method: str, use_brute: bool, limits: dict, unordered: bool,
+                      seed: int, count: int, timeout: float) -> Optional[list]:
+    """Replay a hung batch one case at a time in a fresh worker; return the first input exceeding `timeout`."""
+    pool = multiprocessing.Pool(processes=1)
+    try:
+        for args in _batch_inputs(problem_dir, method, limits, seed, count):
+            res = pool.apply_async(_run_case, (str(problem_dir), method, use_brute, unordered, args))
+            try:
+                res.get(timeout=timeout)
+            except multiprocessing.TimeoutError:
+                return args
+    finally:
+        pool.terminate()
+        pool.join()
+    return None
+
+
+def _shrink_candidates(value, limits: dict):
+    """Yield simpler variants of a value, most aggressive first, staying within limits."""
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        target = min(max(0, limits["min_value"]), limits["max_value"])
+        if value != target:
+            yield target
+            mid = target + (value - target) // 2
+            if mid not in (value, target):
+                yield mid
+            yield value - 1 if value > target else value + 1
+    elif isinstance(value, float):
+        if value != int(value):
+            yield float(int(value))
+        for v in _shrink_candidates(int(value), limits):
+            yield float(v)
+    elif isinstance(value, (str, list)):
+        n = len(value)
+        lo = limits["min_size"]
+        if n > lo:
+            if lo <= n // 2:
+                yield value[: n // 2]
+                yield value[n // 2:]
+            for i in range(n):
+                yield value[:i] + value[i + 1:]
+        if isinstance(value, str):
+            simplest = limits["alphabet"][:1] or "a"
+            for i, ch in enumerate(value):
+                if ch != simplest:
+                    yield value[:i] + simplest + value[i + 1:]
+        else:
+            for i, item in enumerate(value):
+                for c in _shrink_candidates(item, limits):
+                    yield value[:i] + [c] + value[i + 1:]
+
+
+def shrink(problem_dir: Path, method: str, use_brute: bool, limits: dict, args: list, failure: dict,
+           unordered: bool = False, timeout: float = BATCH_TIMEOUT):
+    """Greedily reduce a failing input to a minimal counterexample that still fails.
+
+    Candidates run in a single worker process; one that takes longer than
+    `timeout` seconds (e.g. loops forever) counts as not reproducing.
+    Returns (args, failure) from the last step that reproduced the failure, so a
+    solution that behaves differently on re-runs still yields a consistent report.
+    """
+    pool = multiprocessing.Pool(processes=1)
+    try:
+        steps = 0
+        improved = True
+        while improved and steps < MAX_SHRINK_STEPS:
+            improved = False
+            for idx in range(len(args)):
+                for cand in _shrink_candidates(args[idx], limits):
+                    steps += 1
+                    trial = args[:idx] + [cand] + args[idx + 1:]
+                    res = pool.apply_async(_run_case, (str(problem_dir), method, use_brute, unordered, trial))
+                    try:
+                        result = res.get(timeout=timeout)
+                    except multiprocessing.TimeoutError:
+                        # the worker is stuck on this candidate; replace it and move on
+                        pool.terminate()
+                        pool.join()
+                        pool = multiprocessing.Pool(processes=1)
+                        result = None
+                    if isinstance(result, dict):
+                        args, failure = trial, result
+                        improved = True
+                        break
+                    if steps >= MAX_SHRINK_STEPS:
+                        break
+                if improved:
+                    break
+    finally:
+        pool.terminate()
+        pool.join()
+    return args, failure
+
+
+_UNORDERED_HELPER = '''
+
+def _unordered(x):
+    # "any order" answers: compare with lists sorted recursively
+    if isinstance(x, (list, tuple)):
+        return sorted((_unordered(i) for i in x), key=repr)
+    return x
+'''
+
+
+def _render_test(name: str, method: str, args: list, failure: dict, seed: int, unordered: bool = False) -> str:
+    call_args = ", ".join(repr(a) for a in args)
+    lines = [
+        "",
+        "",
+        "",
+        f"def {name}():",
+        f"    # Minimal counterexample found by `stress` (seed {seed})",
+    ]
+    if "expected" not in failure:
+        # no oracle: the case only has to run without raising
+        lines.append(f"    Solution().{method}({call_args})")
+        return "\n".join(lines) + "\n"
+    expected = failure["expected"]
+    if isinstance(expected, tuple) and expected and expected[0] == "in-place":
+        lines.append(f"    args = [{call_args}]")
+        lines.append(f"    Solution().{method}(*args)")
+        if unordered:
+            lines.append(f"    assert _unordered(args) == _unordered({expected[1]!r})")
+        else:
+            lines.append(f"    assert args == {expected[1]!r}")
+    elif unordered:
+        lines.append(f"    assert _unordered(Solution().{method}({call_args})) == _unordered({expected!r})")
+    elif isinstance(expected, float):
+        lines.append(f"    assert Solution().{method}({call_args}) == pytest.approx({expected!r})")
+    else:
+        lines.append(f"    assert Solution().{method}({call_args}) == {expected!r}")
+    return "\n".join(lines) + "\n"
+
+
+def _header_insert_line(source: str) -> int:
+    """Line count of the leading module docstring and `from __future__` imports (where new imports may go)."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return 0
+    end = 0
+    for i, node in enumerate(tree.body):
+        is_docstring = (
+            i == 0 and isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)
+        )
+        if is_docstring or (isinstance(node, ast.ImportFrom) and node.module == "__future__"):
+            end = node.end_lineno
+        else:
+            break
+    return end
+
+
+def save_counterexample(problem_dir: Path, method: str, args: list, failure: dict, seed: int,
+                        unordered: bool = False) -> str:
+    """Append the counterexample to test_solution.py as a new pytest case; returns the test name."""
+    test_file = problem_dir / "test_solution.py"
+    existing = test_file.read_text(encoding="utf-8") if test_file.exists() else ""
+    header = ""
+    if "import pytest" not in existing:
+        header += "import pytest\n"
+    if "from solution import Solution" not in existing:
+        header += "from solution import Solution\n"
+    taken = set(re.findall(r"def (test_stress_counterexample_\d+)\(", existing))
+    n = 1
+    while f"test_stress_counterexample_{n}" in taken:
+        n += 1
+    name = f"test_stress_counterexample_{n}"
+    body = existing.rstrip("\n") if existing.strip() else ""
+    if header:
+        lines = body.splitlines(keepends=True)
+        at = _header_insert_line(body)
+        if at:
+            body = "".join(lines[:at]) + "\n" + header + "".join(lines[at:])
+        else:
+            body = header + ("\n" + body if body else "")
+    if unordered and "def _unordered(" not in existing:
+        body += "\n" + _UNORDERED_HELPER.rstrip("\n")
+    atomic_write_text(test_file, body + _render_test(name, method, args, failure, seed, unordered))
+    return name
+
+
+def _check_brute(brute_path: Path, method: str):
+    """Make sure brute.py can actually serve as the oracle for Solution.<method>."""
+    cls = getattr(_load_module(brute_path), "Solution", None)
+    if cls is None:
+        raise ValueError(f"No class Solution in {brute_path}")
+    if not callable(getattr(cls, method, None)):
+        raise ValueError(f"brute.py's Solution has no method '{method}'")
+
+
+def stress(problem_dir: Path, cases: int = 10000, workers: Optional[int] = None, seed: Optional[int] = None,
+           method: Optional[str] = None, limits: Optional[dict] = None, save: bool = True,
+           unordered: bool = False, timeout: float = BATCH_TIMEOUT):
+    """
+    Differential testing of solution.py against brute.py (if present) on random inputs.
+
+    Inputs are generated from the Solution method's type annotations and run in
+    batches across a process pool. The first mismatch is shrunk to a minimal
+    counterexample and, if save=True, appended to test_solution.py.
+    Without brute.py only exceptions raised by the solution are reported.
+    unordered=True compares results as "any order" answers (lists sorted recursively).
+    A batch running longer than `timeout` seconds is reported as a hang.
+    Returns True if no failure was found.
+    """
+    limits = {**DEFAULT_LIMITS, **(limits or {})}
+    validate_limits(limits)
+    solution_path = problem_dir / "solution.py"
+    use_brute = (problem_dir / "brute.py").exists()
+    seed = random.randrange(2**32) if seed is None else seed
+    method = find_method(solution_path, method)
+    # fail fast on unsupported signatures or a broken oracle before spinning up workers
+    for t in _param_types(_load_module(solution_path), method):
+        _make_generator(t, limits)
+    if use_brute:
+        _check_brute(problem_dir / "brute.py", method)
+
+    if use_brute:
+        print(f"🔁 Comparing Solution.{method} against brute.py (seed {seed})")
+    else:
+        print(f"⚠️  No brute.py found; only checking Solution.{method} for crashes (seed {seed})")
+
+    batches = [(seed + i, min(BATCH_SIZE, cases - i * BATCH_SIZE)) for i in range(math.ceil(cases / BATCH_SIZE))]
+    processes = workers or os.cpu_count() or 1
+    ran = skipped = 0
+    failing = None
+    hung = None
+    done = queue.Queue()
+    inflight = {}  # batch seed -> (count, start time)
+    start = time.perf_counter()
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        while (batches or inflight) and failing is None and hung is None:
+            # keep at most one batch per worker in flight so start times are real deadlines
+            while batches and len(inflight) < processes:
+                s, n = batches.pop(0)
+                inflight[s] = (n, time.perf_counter())
+                pool.apply_async(
+                    _run_batch, (str(problem_dir), method, use_brute, limits, unordered, s, n),
+                    callback=lambda r, s=s: done.put((s, r)),
+                    error_callback=lambda e, s=s: done.put((s, e)),
+                )
+            deadline = min(t0 for _, t0 in inflight.values()) + timeout
+            try:
+                batch_seed, result = done.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                hung = min(inflight.items(), key=lambda kv: kv[1][1])
+                break
+            del inflight[batch_seed]
+            if isinstance(result, BaseException):
+                raise result
+            count, skip, args, failure = result
+            ran += count
+            skipped += skip
+            if args is not None:
+                failing = (batch_seed, args, failure)
+    finally:
+        # terminate rather than close: a hung worker would otherwise block forever
+        pool.terminate()
+        pool.join()
+    elapsed = time.perf_counter() - start
+    checked = ran - skipped
+    rate = checked / elapsed if elapsed > 0 else float("inf")
+    print(f"⏱️  {checked} cases in {elapsed:.2f}s ({rate:,.0f} cases/s)")
+    if skipped:
+        print(f"⏭️  {skipped} inputs skipped (brute.py raised; treated as outside the constraints)")
+
+    if hung is not None:
+        batch_seed, (count, _) = hung
+        print(f"❌ A batch (seed {batch_seed}) ran longer than {timeout:g}s; the solution probably loops forever.")
+        args = find_hanging_case(problem_dir, method, use_brute, limits, unordered, batch_seed, count, timeout)
+        if args is not None:
+            print(f"🔎 Hanging input: {', '.join(repr(a) for a in args)}")
+        else:
+            print("   No single input exceeded the limit on replay; try a larger --timeout.")
+        return False
+
+    if failing is None:
+        if ran and skipped / ran >= MAX_SKIP_RATIO:
+            print(f"❌ brute.py rejected {skipped / ran:.0%} of the inputs; check brute.py and the input bounds.")
+            return False
+        print("✅ No mismatches found.")
+        return True
+
+    batch_seed, args, failure = failing
+    print(f"❌ Failing input: {', '.join(repr(a) for a in args)}")
+    args, failure = shrink(problem_dir, method, use_brute, limits, args, failure, unordered, timeout)
+    print(f"🔎 Minimal counterexample: {', '.join(repr(a) for a in args)}")
+    print(f"   got:      {failure['got']!r}")
+    if "expected" in failure:
+        print(f"   expected: {failure['expected']!r}")
+    if save:
+        name = save_counterexample(problem_dir, method, args, failure, batch_seed, unordered)
+        print(f"📝 Saved as {name} in {problem_dir / 'test_solution.py'}")
+    return False